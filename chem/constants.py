@@ -190,4 +190,10 @@ ELEMENTS_RU = {
     "майтнерий": "Mt", "дармштадтий": "Ds", "рентгений": "Rg", "коперниций": "Cn",
     "нихоний": "Nh", "флеровий": "Fl", "московий": "Mc", "ливерморий": "Lv",
     "теннессин": "Ts", "оганесон": "Og"
-}
\ No newline at end of file
+}
+
+# Размер порции формул для пакетного расчета
+BATCH_CHUNK_SIZE = 250
+
+# Заголовки таблицы пакетного расчета и экспорта
+BATCH_HEADERS = ["Формула", "Молярная масса, г/моль", "Атомов", "Состав"]
@@ -1,6 +1,15 @@
+import csv
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, Iterator
+
+import numpy as np
 from chempy import Substance
+from openpyxl import Workbook, load_workbook
 from periodictable import elements
 
+from chem.constants import BATCH_CHUNK_SIZE, BATCH_HEADERS
+
 
 def parse_formula(formula: str) -> dict:
     """
@@ -8,11 +17,21 @@ def parse_formula(formula: str) -> dict:
     formula: - химическая формула
     """
 
-    substance = Substance.from_formula(formula)
+    return _substance_composition(Substance.from_formula(formula))
+
+
+def _substance_composition(substance: Substance) -> dict:
+    """
+    Состав уже разобранного вещества: {символ: (атомов, массовая доля)}
+    """
+
     composition = {}
     total_mass = substance.mass
 
     for atomic_number, atom_count in substance.composition.items():
+        # Под ключом 0 chempy хранит заряд иона, это не элемент
+        if atomic_number == 0:
+            continue
         # Элемент по атомному номеру
         elem = elements[atomic_number]
 
@@ -39,4 +58,140 @@ def grams_to_moles(formula: str, grams: int | float) -> int | float:
     """
 
     molar_mass = Substance.from_formula(formula).mass
-    return grams / molar_mass
\ No newline at end of file
+    return grams / molar_mass
+
+
+@lru_cache(maxsize=4096)
+def _batch_entry(formula: str) -> tuple[float, float, str]:
+    """
+    Молярная масса, число атомов и состав одной формулы для пакетного
+    расчета. Формула разбирается один раз, повторы берутся из кэша,
+    ошибка дает (nan, 0, "").
+    Число атомов дробное, если chempy вернул дробные индексы
+    """
+
+    try:
+        substance = Substance.from_formula(formula)
+        composition = _substance_composition(substance)
+    except Exception:
+        return float("nan"), 0, ""
+    atoms = sum(count for count, _ in composition.values())
+    return float(substance.mass), float(atoms), format_composition(composition)
+
+
+def calculate_batch(
+        formulas: Iterable[str],
+        chunk_size: int = BATCH_CHUNK_SIZE
+) -> Iterator[tuple[int, np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Пакетный расчет молярных масс порциями.
+    Возвращает (смещение, массы, число атомов, состав) для каждой порции
+    formulas: - химические формулы
+    chunk_size: - размер порции
+    """
+
+    iterator = iter(formulas)
+    start = 0
+    while chunk := list(islice(iterator, chunk_size)):
+        masses = np.empty(len(chunk), dtype=np.float64)
+        atoms = np.empty(len(chunk), dtype=np.float64)
+        compositions = np.empty(len(chunk), dtype=object)
+        for i, formula in enumerate(chunk):
+            masses[i], atoms[i], compositions[i] = _batch_entry(formula)
+        yield start, masses, atoms, compositions
+        start += len(chunk)
+
+
+def format_composition(composition: dict) -> str:
+    """
+    Состав из parse_formula одной строкой: "H: 2 (2.06%), S: 1 (32.69%)"
+    """
+
+    return ", ".join(
+        f"{elem}: {count:g} ({percent:.2f}%)"
+        for elem, (count, percent) in composition.items()
+    )
+
+
+def _skip_header(formulas: list[str]) -> list[str]:
+    """
+    Убирает строку заголовков, если файл получен из export_csv/export_xlsx
+    """
+
+    if formulas and formulas[0] == BATCH_HEADERS[0]:
+        return formulas[1:]
+    return formulas
+
+
+def split_formulas(text: str) -> list[str]:
+    """
+    Формулы из вставленного столбца таблицы.
+    Берется первая ячейка каждой непустой строки
+    """
+
+    formulas = []
+    for line in text.splitlines():
+        cell = line.split("\t", 1)[0].strip()
+        if cell:
+            formulas.append(cell)
+    return _skip_header(formulas)
+
+
+def read_formulas(path: str) -> list[str]:
+    """
+    Формулы из первого столбца файла .xlsx, .csv или .txt
+    """
+
+    if path.lower().endswith(".xlsx"):
+        workbook = load_workbook(path, read_only=True)
+        try:
+            return _skip_header([
+                str(row[0]).strip()
+                for row in workbook.active.iter_rows(max_col=1, values_only=True)
+                if row and row[0] is not None and str(row[0]).strip()
+            ])
+        finally:
+            workbook.close()
+
+    with open(path, encoding="utf-8-sig", newline="") as file:
+        first_line = file.readline()
+        file.seek(0)
+        # Запятые встречаются в столбце состава, поэтому ";" и табуляция
+        # проверяются первыми
+        delimiter = next((d for d in ";\t," if d in first_line), ";")
+        return _skip_header([
+            row[0].strip()
+            for row in csv.reader(file, delimiter=delimiter)
+            if row and row[0].strip()
+        ])
+
+
+def export_csv(path: str, header: list[str], rows: Iterable[tuple]) -> None:
+    """
+    Построчная запись результатов в CSV для Excel с русской локалью:
+    разделитель ";", дробная часть через запятую
+    """
+
+    with open(path, "w", encoding="utf-8-sig", newline="") as file:
+        writer = csv.writer(file, delimiter=";")
+        writer.writerow(header)
+        for row in rows:
+            writer.writerow([
+                f"{value:.2f}".replace(".", ",") if isinstance(value, float)
+                else value
+                for value in row
+            ])
+
+
+def export_xlsx(path: str, header: list[str], rows: Iterable[tuple]) -> None:
+    """
+    Построчная запись результатов в XLSX.
+    Книга в режиме write_only не держит лист в памяти целиком
+    """
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Результаты")
+    sheet.append(header)
+    for row in rows:
+        sheet.append(row)
+    workbook.save(path)
@@ -1,14 +1,21 @@
-from PyQt5.QtWidgets import (QWidget, QTableWidgetItem, QHeaderView)
+import numpy as np
+from PyQt5.QtWidgets import (QWidget, QTableWidgetItem, QHeaderView, QDialog,
+                             QFileDialog, QApplication)
 from PyQt5.QtGui import QColor, QFont
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import (Qt, QAbstractTableModel, QModelIndex, QThread,
+                          pyqtSignal)
 from periodictable import elements
 
+from ui.BatchDialog import Ui_BatchDialog
 from ui.ChemistryTab import Ui_ChemistryTab
 from ui.PeriodicTableTab import Ui_PeriodicTab
 
 
-from chem.core import parse_formula, calculate_molar_mass, grams_to_moles
-from chem.constants import CATEGORY_COLORS, ELEMENT_POSITIONS, ELEMENTS_RU
+from chem.core import (parse_formula, calculate_molar_mass, grams_to_moles,
+                       calculate_batch, split_formulas,
+                       read_formulas, export_csv, export_xlsx)
+from chem.constants import (CATEGORY_COLORS, ELEMENT_POSITIONS, ELEMENTS_RU,
+                            BATCH_CHUNK_SIZE, BATCH_HEADERS)
 
 
 class ChemistryTab(QWidget):
@@ -23,6 +30,19 @@ class ChemistryTab(QWidget):
         self.ui.search_btn.clicked.connect(self.find_symbol)
         self.ui.calculate_btn.clicked.connect(self.calculate)
         self.ui.convert_btn.clicked.connect(self.convert_grams_to_moles)
+        self.ui.batch_btn.clicked.connect(self.open_batch)
+        self.batch_dialog = None
+
+    def open_batch(self) -> None:
+        """
+        Открывает окно пакетного расчета.
+        Биндится на кнопку "пакетный режим"
+        """
+
+        if self.batch_dialog is None:
+            self.batch_dialog = BatchDialog(self)
+        self.batch_dialog.show()
+        self.batch_dialog.raise_()
 
     def convert_grams_to_moles(self) -> None:
         formula = self.ui.line_convert_formula.text().strip()
@@ -96,6 +116,385 @@ class ChemistryTab(QWidget):
             self.ui.search_res_area.setText("Не найдено")
             self.show_similar_names(name)
 
+
+class BatchResultsModel(QAbstractTableModel):
+    """
+    Модель результатов пакетного расчета поверх массивов NumPy.
+    Таблица запрашивает только видимые строки, сортировка и фильтр
+    перестраивают массив индексов _view без копирования данных
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._formulas = np.empty(0, dtype=str)
+        self._masses = np.empty(0, dtype=np.float64)
+        self._atoms = np.empty(0, dtype=np.float64)
+        self._compositions = np.empty(0, dtype=object)
+        # Количество уже рассчитанных строк
+        self._size = 0
+        # Индексы строк в порядке отображения
+        self._view = np.empty(0, dtype=np.intp)
+        self._filter = ""
+        self._sort_column = -1
+        self._sort_order = Qt.AscendingOrder
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._view)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(BATCH_HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._view[index.row()]
+        column = index.column()
+        mass = self._masses[row]
+
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return str(self._formulas[row])
+            if column == 1:
+                return "Ошибка" if np.isnan(mass) else f"{mass:.2f}"
+            if column == 2:
+                # Дробное, если в формуле дробные индексы
+                return f"{self._atoms[row]:g}"
+            return self._compositions[row]
+        if role == Qt.ForegroundRole and np.isnan(mass):
+            return QColor(200, 0, 0)
+        if role == Qt.TextAlignmentRole and column in (1, 2):
+            return Qt.AlignRight | Qt.AlignVCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return BATCH_HEADERS[section]
+        # Номер строки во входных данных
+        return str(self._view[section] + 1)
+
+    def load(self, formulas: list[str]) -> None:
+        """
+        Подготавливает массивы под новый пакет формул
+        """
+
+        self.beginResetModel()
+        self._formulas = np.array(formulas, dtype=str)
+        self._masses = np.full(len(formulas), np.nan, dtype=np.float64)
+        self._atoms = np.zeros(len(formulas), dtype=np.float64)
+        self._compositions = np.full(len(formulas), "", dtype=object)
+        self._size = 0
+        self._view = np.empty(0, dtype=np.intp)
+        self.endResetModel()
+
+    def add_chunk(self, start: int, masses: np.ndarray, atoms: np.ndarray,
+                  compositions: np.ndarray) -> None:
+        """
+        Добавляет рассчитанную порцию из calculate_batch.
+        Новые строки дописываются в конец, сортировка применяется в finish()
+        """
+
+        end = start + len(masses)
+        self._masses[start:end] = masses
+        self._atoms[start:end] = atoms
+        self._compositions[start:end] = compositions
+        self._size = end
+
+        indices = self._filter_indices(start, end)
+        if not len(indices):
+            return
+        first = len(self._view)
+        self.beginInsertRows(QModelIndex(), first, first + len(indices) - 1)
+        self._view = np.concatenate((self._view, indices))
+        self.endInsertRows()
+
+    def finish(self) -> None:
+        """
+        Упорядочивает строки, дописанные во время расчета
+        """
+
+        if self._sort_column >= 0:
+            self._apply_order()
+
+    def sort(self, column: int, order=Qt.AscendingOrder) -> None:
+        self._sort_column = column
+        self._sort_order = order
+        self._apply_order()
+
+    def set_filter(self, text: str) -> None:
+        """
+        Оставляет строки, формула которых содержит text
+        """
+
+        self._filter = text
+        self.beginResetModel()
+        self._view = self._ordered(self._filter_indices(0, self._size))
+        self.endResetModel()
+
+    def error_count(self) -> int:
+        return int(np.isnan(self._masses[:self._size]).sum())
+
+    def export_rows(self):
+        """
+        Строки в порядке отображения для экспорта, по одной.
+        Порядок фиксируется в момент вызова, масса округляется так же,
+        как в таблице
+        """
+
+        view = self._view.copy()
+        formulas, masses = self._formulas, self._masses
+        atoms, compositions = self._atoms, self._compositions
+
+        def rows():
+            for row in view:
+                formula = str(formulas[row])
+                mass = masses[row]
+                if np.isnan(mass):
+                    yield formula, None, None, ""
+                    continue
+                count = float(atoms[row])
+                count = int(count) if count.is_integer() else round(count, 2)
+                yield formula, round(float(mass), 2), count, compositions[row]
+
+        return rows()
+
+    def _filter_indices(self, start: int, end: int) -> np.ndarray:
+        indices = np.arange(start, end)
+        if self._filter:
+            mask = np.char.find(self._formulas[start:end], self._filter) >= 0
+            indices = indices[mask]
+        return indices
+
+    def _ordered(self, indices: np.ndarray) -> np.ndarray:
+        """
+        Сортирует индексы по выбранному столбцу.
+        Ошибочные формулы при сортировке всегда в конце
+        """
+
+        if self._sort_column < 0:
+            return np.sort(indices)
+        keys = (self._formulas, self._masses, self._atoms,
+                self._compositions)[self._sort_column]
+        if self._sort_order == Qt.DescendingOrder:
+            # Обратный проход стабильной сортировки: равные значения
+            # остаются в исходном порядке
+            indices = indices[::-1]
+            indices = indices[np.argsort(keys[indices], kind="stable")][::-1]
+        else:
+            indices = indices[np.argsort(keys[indices], kind="stable")]
+        invalid = np.isnan(self._masses[indices])
+        return np.concatenate((indices[~invalid], indices[invalid]))
+
+    def _apply_order(self) -> None:
+        """
+        Меняет порядок строк без сброса модели:
+        выделение и прокрутка таблицы сохраняются
+        """
+
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        sources = [(self._view[index.row()], index.column())
+                   for index in persistent]
+
+        self._view = self._ordered(self._view)
+        positions = np.empty(self._size, dtype=np.intp)
+        positions[self._view] = np.arange(len(self._view))
+
+        self.changePersistentIndexList(
+            persistent,
+            [self.index(int(positions[row]), column) for row, column in sources])
+        self.layoutChanged.emit()
+
+
+class BatchThread(QThread):
+    """
+    Пакетный расчет в фоновом потоке, порции передаются сигналом
+    """
+
+    chunk_ready = pyqtSignal(int, object, object, object)
+
+    def __init__(self, formulas: list[str], parent=None) -> None:
+        super().__init__(parent)
+        self._formulas = formulas
+
+    def run(self) -> None:
+        for start, masses, atoms, compositions in calculate_batch(self._formulas):
+            if self.isInterruptionRequested():
+                return
+            self.chunk_ready.emit(start, masses, atoms, compositions)
+
+
+class ExportThread(QThread):
+    """
+    Экспорт в фоновом потоке с отчетом о количестве записанных строк
+    """
+
+    progress = pyqtSignal(int)
+
+    def __init__(self, writer, path: str, rows, parent=None) -> None:
+        super().__init__(parent)
+        self._writer = writer
+        self._path = path
+        self._rows = rows
+        self.error = False
+
+    def run(self) -> None:
+        try:
+            self._writer(self._path, BATCH_HEADERS, self._counted_rows())
+        except Exception:
+            self.error = True
+
+    def _counted_rows(self):
+        for count, row in enumerate(self._rows, 1):
+            if count % BATCH_CHUNK_SIZE == 0:
+                self.progress.emit(count)
+            yield row
+
+
+class BatchDialog(QDialog):
+    """
+    Окно пакетного расчета: вставка столбца формул или файл,
+    расчет и экспорт в CSV/XLSX в фоновых потоках
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.ui = Ui_BatchDialog()
+        self.ui.setupUi(self)
+
+        self.model = BatchResultsModel(self)
+        self.ui.batch_table.setModel(self.model)
+        self.ui.batch_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.ui.batch_table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+
+        self._thread = None
+        QApplication.instance().aboutToQuit.connect(self.stop)
+
+        self.ui.batch_calc_btn.clicked.connect(self.calculate_pasted)
+        self.ui.open_file_btn.clicked.connect(self.open_file)
+        self.ui.line_filter.textChanged.connect(
+            lambda text: self.model.set_filter(text.strip()))
+        self.ui.export_csv_btn.clicked.connect(
+            lambda: self.export("CSV (*.csv)", export_csv))
+        self.ui.export_xlsx_btn.clicked.connect(
+            lambda: self.export("Excel (*.xlsx)", export_xlsx))
+
+    def calculate_pasted(self) -> None:
+        """
+        Расчет формул, вставленных в поле ввода.
+        Биндится на кнопку "рассчитать"
+        """
+
+        self.start_batch(split_formulas(self.ui.batch_input.toPlainText()))
+
+    def open_file(self) -> None:
+        """
+        Расчет формул из первого столбца файла
+        """
+
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Открыть файл", "", "Таблицы (*.xlsx *.csv *.txt)")
+        if not path:
+            return
+        try:
+            formulas = read_formulas(path)
+        except Exception:
+            self.ui.batch_status.setText(
+                "<font color='red'>Не удалось прочитать файл</font>")
+            return
+        self.start_batch(formulas)
+
+    def start_batch(self, formulas: list[str]) -> None:
+        if not formulas:
+            self.ui.batch_status.setText(
+                "<font color='red'>Необходимо ввести формулы</font>")
+            return
+
+        self.model.load(formulas)
+        self.ui.batch_progress.setMaximum(len(formulas))
+        self.ui.batch_progress.setValue(0)
+        self.ui.batch_status.setText("Расчет...")
+        # Новые порции дописываются в конец, сортировка применится в конце
+        self.ui.batch_table.horizontalHeader().setSortIndicatorShown(False)
+
+        self._thread = BatchThread(formulas, self)
+        self._thread.chunk_ready.connect(self.add_chunk)
+        self._thread.finished.connect(self.batch_finished)
+        self.set_busy(True)
+        self._thread.start()
+
+    def add_chunk(self, start: int, masses, atoms, compositions) -> None:
+        self.model.add_chunk(start, masses, atoms, compositions)
+        self.ui.batch_progress.setValue(start + len(masses))
+
+    def batch_finished(self) -> None:
+        self._thread.deleteLater()
+        self._thread = None
+        self.model.finish()
+        self.ui.batch_table.horizontalHeader().setSortIndicatorShown(True)
+        self.set_busy(False)
+        self.ui.batch_status.setText(
+            f"<b>Готово:</b> {self.ui.batch_progress.maximum()} формул, "
+            f"ошибок: {self.model.error_count()}")
+
+    def export(self, file_filter: str, writer) -> None:
+        """
+        Сохраняет отображаемые строки (с учетом фильтра и сортировки)
+        """
+
+        rows_count = self.model.rowCount()
+        if not rows_count:
+            self.ui.batch_status.setText(
+                "<font color='red'>Нет результатов для экспорта</font>")
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Экспорт", "", file_filter)
+        if not path:
+            return
+
+        self.ui.batch_progress.setMaximum(rows_count)
+        self.ui.batch_progress.setValue(0)
+        self.ui.batch_status.setText("Экспорт...")
+
+        self._thread = ExportThread(writer, path, self.model.export_rows(), self)
+        self._thread.progress.connect(self.ui.batch_progress.setValue)
+        self._thread.finished.connect(lambda: self.export_finished(path))
+        self.set_busy(True)
+        self._thread.start()
+
+    def export_finished(self, path: str) -> None:
+        error = self._thread.error
+        self._thread.deleteLater()
+        self._thread = None
+        self.set_busy(False)
+        if error:
+            self.ui.batch_status.setText(
+                "<font color='red'>Не удалось сохранить файл</font>")
+            return
+        self.ui.batch_progress.setValue(self.ui.batch_progress.maximum())
+        self.ui.batch_status.setText(f"<b>Сохранено:</b> {path}")
+
+    def set_busy(self, busy: bool) -> None:
+        """
+        Блокирует кнопки, фильтр и сортировку, пока работает фоновый поток
+        """
+
+        for widget in (self.ui.batch_calc_btn, self.ui.open_file_btn,
+                       self.ui.export_csv_btn, self.ui.export_xlsx_btn,
+                       self.ui.line_filter):
+            widget.setEnabled(not busy)
+        self.ui.batch_table.horizontalHeader().setSectionsClickable(not busy)
+
+    def stop(self) -> None:
+        """
+        Останавливает фоновый поток перед выходом из приложения
+        """
+
+        if self._thread is not None:
+            self._thread.requestInterruption()
+            self._thread.wait()
+
+
 class PeriodTableTab(QWidget):
 
     def __init__(self):
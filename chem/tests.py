@@ -0,0 +1,160 @@
+import math
+
+import pytest
+from PyQt5.QtCore import Qt
+
+from chem.constants import BATCH_HEADERS
+from chem.core import (calculate_batch, export_csv, export_xlsx,
+                       format_composition, parse_formula, read_formulas,
+                       split_formulas)
+from chem.gui import BatchResultsModel
+
+
+def test_split_formulas_takes_first_cell():
+    text = "H2O\t18\n\n  NaCl \nH2SO4\tкислота\n"
+    assert split_formulas(text) == ["H2O", "NaCl", "H2SO4"]
+
+
+def test_split_formulas_skips_header():
+    assert split_formulas("Формула\tМасса\nH2O\t18") == ["H2O"]
+
+
+def test_calculate_batch_chunks():
+    chunks = list(calculate_batch(["H2O", "Xx", "NaCl"], chunk_size=2))
+
+    assert [start for start, *_ in chunks] == [0, 2]
+    _, masses, atoms, compositions = chunks[0]
+    assert masses[0] == pytest.approx(18.015, abs=0.01)
+    assert math.isnan(masses[1])
+    assert list(atoms) == [3, 0]
+    assert compositions[0] == format_composition(parse_formula("H2O"))
+    assert compositions[1] == ""
+
+
+def test_format_composition():
+    assert format_composition(parse_formula("NaCl")) == \
+        "Na: 1 (39.34%), Cl: 1 (60.66%)"
+
+
+@pytest.mark.parametrize("writer, name", [(export_csv, "out.csv"),
+                                          (export_xlsx, "out.xlsx")])
+def test_export_read_round_trip(tmp_path, writer, name):
+    path = str(tmp_path / name)
+    rows = [("H2SO4", 98.08, 7, format_composition(parse_formula("H2SO4"))),
+            ("Xx", None, None, "")]
+
+    writer(path, BATCH_HEADERS, rows)
+
+    assert read_formulas(path) == ["H2SO4", "Xx"]
+
+
+def test_export_csv_rounds_for_excel(tmp_path):
+    path = tmp_path / "out.csv"
+
+    export_csv(str(path), BATCH_HEADERS, [("CH", 13.018999999999998, 2, "")])
+
+    assert path.read_text(encoding="utf-8-sig").splitlines()[1] == "CH;13,02;2;"
+
+
+def test_read_formulas_tab_separated(tmp_path):
+    path = tmp_path / "in.txt"
+    path.write_text("H2O\t1\nNaCl\t2\n", encoding="utf-8")
+
+    assert read_formulas(str(path)) == ["H2O", "NaCl"]
+
+
+def make_model(formulas):
+    model = BatchResultsModel()
+    model.load(formulas)
+    for chunk in calculate_batch(formulas, chunk_size=2):
+        model.add_chunk(*chunk)
+    model.finish()
+    return model
+
+
+def column(model, number):
+    return [model.data(model.index(row, number))
+            for row in range(model.rowCount())]
+
+
+def test_model_sort_puts_errors_last():
+    model = make_model(["H2SO4", "Xx", "H2O", "NaCl"])
+
+    model.sort(1, Qt.AscendingOrder)
+    assert column(model, 0) == ["H2O", "NaCl", "H2SO4", "Xx"]
+
+    model.sort(1, Qt.DescendingOrder)
+    assert column(model, 0) == ["H2SO4", "NaCl", "H2O", "Xx"]
+
+    model.sort(-1)
+    assert column(model, 0) == ["H2SO4", "Xx", "H2O", "NaCl"]
+
+
+def test_model_filter_subset():
+    model = make_model(["H2SO4", "NaCl", "H2O", "CH4"])
+
+    model.set_filter("H2")
+    assert column(model, 0) == ["H2SO4", "H2O"]
+
+    model.set_filter("")
+    assert model.rowCount() == 4
+
+
+def test_model_sort_applied_after_batch():
+    model = BatchResultsModel()
+    formulas = ["NaCl", "H2O", "H2SO4"]
+    model.load(formulas)
+    model.sort(1, Qt.AscendingOrder)
+
+    for chunk in calculate_batch(formulas, chunk_size=1):
+        model.add_chunk(*chunk)
+    model.finish()
+
+    assert column(model, 0) == ["H2O", "NaCl", "H2SO4"]
+    assert list(model.export_rows())[0][:3] == ("H2O", 18.02, 3)
+
+
+@pytest.mark.parametrize("formula, atoms, composition", [
+    ("SO4-2", 5, "S: 1 (33.38%), O: 4 (66.62%)"),
+    ("Fe+3", 1, "Fe: 1 (100.00%)"),
+])
+def test_calculate_batch_ions_skip_charge(formula, atoms, composition):
+    _, _, atoms_array, compositions = next(calculate_batch([formula]))
+
+    assert atoms_array[0] == atoms
+    assert compositions[0] == composition
+
+
+def test_model_keeps_fractional_atoms():
+    model = make_model(["CuSO4.5H2O"])
+
+    assert column(model, 2) == ["9.5"]
+    assert list(model.export_rows())[0][2] == 9.5
+
+
+def test_model_sort_by_composition():
+    model = make_model(["NaCl", "H2O", "CH4"])
+
+    model.sort(3, Qt.AscendingOrder)
+    assert column(model, 3) == sorted(column(model, 3))
+
+
+def test_model_sort_keeps_ties_in_input_order():
+    model = make_model(["H2O", "NaCl", "CH4", "H2O", "NaCl"])
+
+    model.sort(2, Qt.DescendingOrder)
+    assert [model.headerData(row, Qt.Vertical)
+            for row in range(model.rowCount())] == ["3", "1", "4", "2", "5"]
+
+    model.sort(2, Qt.AscendingOrder)
+    assert [model.headerData(row, Qt.Vertical)
+            for row in range(model.rowCount())] == ["2", "5", "1", "4", "3"]
+
+
+def test_model_export_rows_snapshot_view():
+    model = make_model(["H2SO4", "NaCl", "H2O"])
+
+    rows = model.export_rows()
+    model.set_filter("Na")
+
+    assert [row[0] for row in rows] == ["H2SO4", "NaCl", "H2O"]
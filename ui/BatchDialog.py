@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file '.\BatchDialog.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_BatchDialog(object):
+    def setupUi(self, BatchDialog):
+        BatchDialog.setObjectName("BatchDialog")
+        BatchDialog.resize(1000, 700)
+        self.verticalLayout = QtWidgets.QVBoxLayout(BatchDialog)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.batch_input = QtWidgets.QPlainTextEdit(BatchDialog)
+        self.batch_input.setMaximumSize(QtCore.QSize(16777215, 150))
+        self.batch_input.setObjectName("batch_input")
+        self.verticalLayout.addWidget(self.batch_input)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.open_file_btn = QtWidgets.QPushButton(BatchDialog)
+        self.open_file_btn.setObjectName("open_file_btn")
+        self.horizontalLayout.addWidget(self.open_file_btn)
+        self.batch_calc_btn = QtWidgets.QPushButton(BatchDialog)
+        self.batch_calc_btn.setObjectName("batch_calc_btn")
+        self.horizontalLayout.addWidget(self.batch_calc_btn)
+        self.line_filter = QtWidgets.QLineEdit(BatchDialog)
+        self.line_filter.setObjectName("line_filter")
+        self.horizontalLayout.addWidget(self.line_filter)
+        self.export_csv_btn = QtWidgets.QPushButton(BatchDialog)
+        self.export_csv_btn.setObjectName("export_csv_btn")
+        self.horizontalLayout.addWidget(self.export_csv_btn)
+        self.export_xlsx_btn = QtWidgets.QPushButton(BatchDialog)
+        self.export_xlsx_btn.setObjectName("export_xlsx_btn")
+        self.horizontalLayout.addWidget(self.export_xlsx_btn)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+        self.batch_progress = QtWidgets.QProgressBar(BatchDialog)
+        self.batch_progress.setProperty("value", 0)
+        self.batch_progress.setObjectName("batch_progress")
+        self.verticalLayout.addWidget(self.batch_progress)
+        self.batch_table = QtWidgets.QTableView(BatchDialog)
+        self.batch_table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.batch_table.setAlternatingRowColors(True)
+        self.batch_table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.batch_table.setSortingEnabled(True)
+        self.batch_table.setObjectName("batch_table")
+        self.batch_table.horizontalHeader().setStretchLastSection(True)
+        self.verticalLayout.addWidget(self.batch_table)
+        self.batch_status = QtWidgets.QLabel(BatchDialog)
+        self.batch_status.setText("")
+        self.batch_status.setObjectName("batch_status")
+        self.verticalLayout.addWidget(self.batch_status)
+
+        self.retranslateUi(BatchDialog)
+        QtCore.QMetaObject.connectSlotsByName(BatchDialog)
+
+    def retranslateUi(self, BatchDialog):
+        _translate = QtCore.QCoreApplication.translate
+        BatchDialog.setWindowTitle(_translate("BatchDialog", "Пакетный расчет"))
+        self.batch_input.setPlaceholderText(_translate("BatchDialog", "Вставьте столбец формул из таблицы (по одной в строке)"))
+        self.open_file_btn.setText(_translate("BatchDialog", "Открыть файл"))
+        self.batch_calc_btn.setText(_translate("BatchDialog", "Расчитать"))
+        self.line_filter.setPlaceholderText(_translate("BatchDialog", "Фильтр по формуле"))
+        self.export_csv_btn.setText(_translate("BatchDialog", "Экспорт CSV"))
+        self.export_xlsx_btn.setText(_translate("BatchDialog", "Экспорт XLSX"))
@@ -48,6 +48,9 @@ class Ui_ChemistryTab(object):
         self.calc_res_area.setReadOnly(True)
         self.calc_res_area.setObjectName("calc_res_area")
         self.gridLayout.addWidget(self.calc_res_area, 3, 1, 1, 1)
+        self.batch_btn = QtWidgets.QPushButton(self.gridLayoutWidget)
+        self.batch_btn.setObjectName("batch_btn")
+        self.gridLayout.addWidget(self.batch_btn, 3, 2, 1, 1, QtCore.Qt.AlignTop)
         self.gridLayoutWidget_2 = QtWidgets.QWidget(ChemistryTab)
         self.gridLayoutWidget_2.setGeometry(QtCore.QRect(0, 440, 1161, 123))
         self.gridLayoutWidget_2.setObjectName("gridLayoutWidget_2")
@@ -97,6 +100,7 @@ class Ui_ChemistryTab(object):
         self.search_btn.setText(_translate("ChemistryTab", "Найти символ"))
         self.calculate_btn.setText(_translate("ChemistryTab", "Расчитать"))
         self.label_search_elem.setText(_translate("ChemistryTab", "Поиск элемента"))
+        self.batch_btn.setText(_translate("ChemistryTab", "Пакетный режим"))
         self.label_convert_elem.setText(_translate("ChemistryTab", "Конвертация"))
         self.line_convert_gramms.setPlaceholderText(_translate("ChemistryTab", "Введите граммы (14.02)"))
         self.line_convert_formula.setPlaceholderText(_translate("ChemistryTab", "Введите формулу (H2SO4)"))